@@ -9,6 +9,7 @@ metadata creation, document lookup, and state management.
 import os
 import json
 import uuid
+import time
 import logging
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
@@ -301,6 +302,108 @@ class ReMarkableService:
             self._logger.error(f"Unsupported file type: {file_ext}")
             return None
     
+    def _fetch_metadata_index(self) -> Optional[List[Tuple[str, List[str]]]]:
+        """
+        Fetch the lower-cased lines of every metadata file in one command.
+        
+        Returns:
+            List of (UUID, metadata lines) in the same order as the shell glob
+            used by hash_from_title, None if the listing failed
+        """
+        # Each file becomes one output line; its own newlines become \x1f so
+        # the lines grep would search can be recovered
+        list_command = (
+            f"cd {self.xochitl_share_path} && for f in *.metadata; do "
+            f"[ -f \"$f\" ] || continue; "
+            f"printf '%s\\t' \"${{f%.metadata}}\"; tr '\\n' '\\037' < \"$f\"; echo; done"
+        )
+        result = self._execute_command(list_command)
+        
+        if not result.success:
+            self._logger.warning(f"Failed to list document metadata: {result.stderr}")
+            return None
+        
+        metadata_index: List[Tuple[str, List[str]]] = []
+        for line in result.stdout.split('\n'):
+            document_uuid, _, metadata_text = line.partition('\t')
+            if metadata_text:
+                metadata_index.append((document_uuid.strip(), metadata_text.lower().split('\x1f')))
+        
+        return metadata_index
+    
+    @staticmethod
+    def _find_in_metadata_index(metadata_index: List[Tuple[str, List[str]]], title: str) -> Optional[str]:
+        """Return the first UUID whose metadata has a line containing title, ignoring case."""
+        needle = title.lower()
+        for document_uuid, lines in metadata_index:
+            if any(needle in line for line in lines):
+                return document_uuid
+        return None
+    
+    def add_with_metadata_if_new_batch(self, files: List[Tuple[Path, Optional[str]]],
+                                       restart_xochitl: bool = True) -> List[Optional[str]]:
+        """
+        Add several files, skipping those whose title already exists on the device.
+        
+        Existing titles are looked up with a single remote command instead of one
+        search per file, and xochitl is restarted at most once at the end.
+        
+        A title counts as existing under the same rule as hash_from_title (and so
+        add_with_metadata_if_new): some line of a metadata file contains it,
+        ignoring case. The title is matched as plain text, whereas grep would
+        treat regex metacharacters in it specially.
+        
+        Args:
+            files: List of (local_file_path, title) tuples; a None title defaults
+                to the filename without extension
+            restart_xochitl: Whether to restart xochitl service after adding
+        
+        Returns:
+            List of document UUIDs (or None on error) in the same order as files
+        """
+        if not files:
+            return []
+        
+        metadata_index = self._fetch_metadata_index()
+        if metadata_index is None:
+            return [None] * len(files)
+        
+        results: List[Optional[str]] = []
+        added_count = 0
+        
+        for local_file_path, title in files:
+            if title is None:
+                title = local_file_path.stem
+            
+            # Blank titles are never looked up, as in hash_from_title
+            existing_uuid = self._find_in_metadata_index(metadata_index, title) if title.strip() else None
+            if existing_uuid:
+                self._logger.info(f"Document '{title}' already exists with UUID: {existing_uuid}")
+                results.append(existing_uuid)
+                continue
+            
+            file_ext = local_file_path.suffix.lower()
+            if file_ext == ".pdf":
+                document_uuid = self.add_pdf_with_metadata(local_file_path, title, restart_xochitl=False)
+            elif file_ext == ".epub":
+                document_uuid = self.add_epub_with_metadata(local_file_path, title, restart_xochitl=False)
+            else:
+                self._logger.error(f"Unsupported file type: {file_ext}")
+                document_uuid = None
+            
+            if document_uuid:
+                # Later entries in this batch see the new document's metadata
+                metadata_text = self._create_metadata_file(document_uuid, title)
+                metadata_index.append((document_uuid, [metadata_text.lower()]))
+                added_count += 1
+            results.append(document_uuid)
+        
+        if restart_xochitl and added_count:
+            if not self._restart_xochitl():
+                self._logger.warning("Failed to restart xochitl service")
+        
+        return results
+    
     def last_read_document(self) -> Optional[str]:
         """
         Get the most recently opened document (replicates lastReadDocument bash function).
@@ -375,24 +478,58 @@ class ReMarkableService:
         """
         Restart the xochitl service on ReMarkable device.
         
+        The restart is started in the background on the device and this method
+        returns as soon as a new xochitl process is running, rather than waiting
+        for systemctl to finish.
+        
         Returns:
             True if restart successful, False otherwise
         """
         try:
             self._logger.debug("Restarting xochitl service")
-            result = self._execute_command("systemctl restart xochitl")
+            restart_command = "pidof xochitl; (systemctl restart xochitl >/dev/null 2>&1 &)"
+            result = self._execute_command(restart_command)
+            
+            if not result.success:
+                self._logger.error(f"Failed to restart xochitl: {result.stderr}")
+                return False
             
-            if result.success:
+            if self._wait_for_xochitl(previous_pid=result.stdout.strip()):
                 self._logger.info("Successfully restarted xochitl service")
                 return True
             else:
-                self._logger.error(f"Failed to restart xochitl: {result.stderr}")
+                self._logger.error("Timed out waiting for xochitl to come back up")
                 return False
                 
         except Exception as e:
             self._logger.error(f"Error restarting xochitl: {e}")
             return False
     
+    def _wait_for_xochitl(self, previous_pid: str = "", timeout: float = 10.0,
+                          poll_interval: float = 0.25) -> bool:
+        """
+        Poll the device until a new xochitl process is running.
+        
+        Args:
+            previous_pid: PID of the xochitl process before the restart
+            timeout: Maximum time to wait in seconds
+            poll_interval: Delay between readiness probes in seconds
+            
+        Returns:
+            True if xochitl is running with a new PID, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            result = self._execute_command("pidof xochitl")
+            current_pid = result.stdout.strip()
+            if result.success and current_pid and current_pid != previous_pid:
+                return True
+            
+            if time.monotonic() + poll_interval > deadline:
+                return False
+            time.sleep(poll_interval)
+    
     def get_document_info(self, document_uuid: str) -> Optional[Dict[str, Any]]:
         """
         Get information about a document by UUID.
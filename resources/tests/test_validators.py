@@ -0,0 +1,43 @@
+"""
+Tests for readMarkable input validators.
+"""
+
+import copy
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the resources directory to the path, as main.py does
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from utils import validators
+from utils.validators import Validator
+
+
+@pytest.mark.parametrize("address", ["010.11.99.1", "1.2.3.04", "999.1.1.1"])
+def test_malformed_ipv4_literal_is_not_resolved_as_hostname(monkeypatch, address):
+    def fail_lookup(hostname):
+        raise AssertionError(f"unexpected hostname lookup for {hostname!r}")
+
+    monkeypatch.setattr(validators, "_resolve_host", fail_lookup)
+
+    result = Validator().validate_ip_address(address, allow_hostnames=True)
+
+    assert not result.is_valid
+    assert result.message.startswith("Invalid IP address format")
+
+
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda r: pickle.loads(pickle.dumps(r))])
+def test_validation_results_can_be_copied_and_pickled(clone):
+    shared = Validator().validate_ip_address("")
+    built = Validator().validate_ip_address("10.11.99.1")
+
+    for result in (shared, built):
+        cloned = clone(result)
+        assert cloned.is_valid == result.is_valid
+        assert cloned.message == result.message
+        assert cloned.details == dict(result.details)
@@ -2,12 +2,34 @@
 Utilities module for readMarkable.
 
 Provides logging, validation, and utility functions.
+Submodules are imported lazily on first attribute access.
 """
 
-from .logger import setup_logging, get_logger
-from .validators import validate_ip, validate_path, validate_sync_dir, get_validator
+import importlib
+
+_LAZY = {
+    'setup_logging': 'logger',
+    'get_logger': 'logger',
+    'validate_ip': 'validators',
+    'validate_path': 'validators',
+    'validate_sync_dir': 'validators',
+    'get_validator': 'validators',
+}
 
 __all__ = [
     'setup_logging', 'get_logger',
     'validate_ip', 'validate_path', 'validate_sync_dir', 'get_validator'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""
+Bulk validation helpers for readMarkable.
+
+Validates many inputs in one call without building a ValidationResult
+per item, for device scans and library-wide checks.
+"""
+
+from typing import Iterable, List
+
+from .validators import _fast_parse_ipv4, _ipv4_int_rejection
+
+
+def validate_ipv4_bulk(addresses: Iterable[str]) -> List[bool]:
+    """
+    Check many IPv4 literals at once.
+    
+    An entry is True exactly when Validator.validate_ip_address would
+    accept it without hostname resolution.
+    
+    Args:
+        addresses: IP address strings to check
+        
+    Returns:
+        List of booleans, one per input in order
+    """
+    parse = _fast_parse_ipv4
+    results = []
+    append = results.append
+    for address in addresses:
+        if not address or not isinstance(address, str):
+            append(False)
+            continue
+        ip_int = parse(address.strip())
+        append(ip_int is not None and _ipv4_int_rejection(ip_int) is None)
+    return results
\ No newline at end of file
@@ -5,15 +5,43 @@ This module provides a custom logger with colored output,
 multiple log levels, file logging, and GUI log handler interfaces.
 """
 
+import os
+import re
 import sys
+import atexit
+import functools
 import logging
 import logging.handlers
+import queue
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Dict, Any, Callable, List, TextIO
+from typing import Optional, Dict, Any, Callable, List, TextIO, Tuple, NamedTuple
 from datetime import datetime
 from enum import Enum
 
 
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+
+@functools.lru_cache(maxsize=128)
+def _centered(title: str, char: str, width: int = 70) -> str:
+    """Return title padded with char and centered to width."""
+    return f" {title} ".center(width, char)
+
+
+@functools.lru_cache(maxsize=128)
+def _header_block(title: str, char: str, width: int = 70) -> str:
+    """Return a centered title between two separator lines as one string."""
+    separator = char * width
+    return f"{separator}\n{_centered(title, char, width)}\n{separator}"
+
+
+def _skip_find_caller(stack_info: bool = False, stacklevel: int = 1):
+    """Stand-in for Logger.findCaller that skips the stack walk."""
+    return "(unknown file)", 0, "(unknown function)", None
+
+
 class LogLevel(Enum):
     """Custom log levels for readMarkable."""
     DEBUG = 10
@@ -23,6 +51,10 @@ class LogLevel(Enum):
     HIGHLIGHT = 35  # Custom level between WARNING and ERROR
 
 
+# Register custom log level name once at import time
+logging.addLevelName(LogLevel.HIGHLIGHT.value, "HIGHLIGHT")
+
+
 class ColorCodes:
     """ANSI color codes for console output."""
     RED = '\033[0;31m'
@@ -35,9 +67,7 @@ class ColorCodes:
     @classmethod
     def strip_colors(cls, text: str) -> str:
         """Remove ANSI color codes from text."""
-        import re
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        return _ANSI_ESCAPE_RE.sub('', text)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -54,25 +84,15 @@ class ColoredFormatter(logging.Formatter):
         self.colored = colored
         self.show_timestamp = show_timestamp
         
-        # Format patterns
-        if show_timestamp:
-            self.formats = {
-                LogLevel.DEBUG.value: "[DEBUG] %(message)s",
-                LogLevel.INFO.value: "[INFO] %(message)s", 
-                LogLevel.WARNING.value: "[WARNING] %(message)s",
-                LogLevel.ERROR.value: "[ERROR] %(message)s",
-                LogLevel.HIGHLIGHT.value: "[SYNC] %(message)s",
-                logging.INFO: "[%(asctime)s] %(message)s"  # Default for log() function
-            }
-        else:
-            self.formats = {
-                LogLevel.DEBUG.value: "[DEBUG] %(message)s",
-                LogLevel.INFO.value: "[INFO] %(message)s",
-                LogLevel.WARNING.value: "[WARNING] %(message)s", 
-                LogLevel.ERROR.value: "[ERROR] %(message)s",
-                LogLevel.HIGHLIGHT.value: "[SYNC] %(message)s",
-                logging.INFO: "%(message)s"
-            }
+        # Format patterns; LogLevel.INFO shares its level number with the
+        # default log() format, so only the latter is kept
+        self.formats = {
+            LogLevel.DEBUG.value: "[DEBUG] %(message)s",
+            LogLevel.WARNING.value: "[WARNING] %(message)s",
+            LogLevel.ERROR.value: "[ERROR] %(message)s",
+            LogLevel.HIGHLIGHT.value: "[SYNC] %(message)s",
+            logging.INFO: "[%(asctime)s] %(message)s" if show_timestamp else "%(message)s"
+        }
         
         # Color mappings
         self.colors = {
@@ -84,55 +104,94 @@ class ColoredFormatter(logging.Formatter):
             logging.INFO: ColorCodes.GREEN  # Default for log() function
         }
         
-        super().__init__()
+        super().__init__(datefmt='%Y-%m-%d %H:%M:%S' if show_timestamp else None)
+        
+        # Build per-level formatters once instead of on every record
+        self._formatters = {
+            level: logging.Formatter(log_format, self.datefmt)
+            for level, log_format in self.formats.items()
+        }
+        self._default_formatter = logging.Formatter("[%(levelname)s] %(message)s", self.datefmt)
+        
+        # Colour decision is fixed for the life of the formatter since the
+        # TTY status of stdout does not change at runtime; stdout may be None
+        # under pythonw or a windowed build
+        isatty = getattr(sys.stdout, "isatty", None)
+        self._emit_colors = bool(colored) and isatty is not None and isatty()
+        
+        # Pre-built (prefix, suffix) pairs for wrapping messages in color
+        self._color_wrap = {level: (color, ColorCodes.NC) for level, color in self.colors.items()}
+        self._default_wrap = (ColorCodes.NC, ColorCodes.NC)
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with appropriate colors and style."""
-        # Choose format pattern
-        log_format = self.formats.get(record.levelno, "[%(levelname)s] %(message)s")
-        
-        # Set timestamp format
-        if self.show_timestamp and record.levelno == logging.INFO:
-            self.datefmt = '%Y-%m-%d %H:%M:%S'
-        
-        formatter = logging.Formatter(log_format, self.datefmt)
+        # Choose cached formatter for this level
+        formatter = self._formatters.get(record.levelno, self._default_formatter)
         formatted_message = formatter.format(record)
         
+        # Keep the uncolored text on the record so later handlers can reuse it
+        record._rm_formatted = formatted_message
+        
         # Add colors if enabled
-        if self.colored and sys.stdout.isatty():
-            color = self.colors.get(record.levelno, ColorCodes.NC)
-            formatted_message = f"{color}{formatted_message}{ColorCodes.NC}"
+        if self._emit_colors:
+            prefix, suffix = self._color_wrap.get(record.levelno, self._default_wrap)
+            formatted_message = prefix + formatted_message + suffix
         
         return formatted_message
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_formatter(colored: bool) -> ColoredFormatter:
+    """
+    Return the formatter shared by all handlers for the given color setting.
+    
+    ColoredFormatter keeps no per-record state, so one instance per setting
+    is enough. It is built on first use rather than at import time so the
+    TTY check sees the stdout of the running application.
+    """
+    return ColoredFormatter(colored=colored, show_timestamp=True)
+
+
+class LogEntry(NamedTuple):
+    """Log entry stored by GUILogHandler."""
+    timestamp: float  # record.created, seconds since the epoch
+    level: int
+    level_name: str
+    message: str
+    raw_message: str
+
+
 class GUILogHandler(logging.Handler):
     """Log handler that can send messages to GUI components."""
     
-    def __init__(self, callback: Optional[Callable[[str, int], None]] = None):
+    def __init__(self, callback: Optional[Callable[[str, int], None]] = None,
+                 max_entries: int = 10_000):
         """
         Initialize GUI log handler.
         
         Args:
             callback: Function to call with (message, level) for each log entry
+            max_entries: Maximum number of log entries to keep; oldest are dropped first
         """
         super().__init__()
         self.callback = callback
-        self.log_entries: List[Dict[str, Any]] = []
+        self.max_entries = max_entries
+        self.log_entries: deque = deque(maxlen=max_entries)
     
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record to GUI."""
         try:
-            msg = self.format(record)
+            # Reuse text already produced by the console formatter if available
+            msg = getattr(record, '_rm_formatted', None) or self.format(record)
             
-            # Store log entry
-            self.log_entries.append({
-                'timestamp': datetime.fromtimestamp(record.created),
-                'level': record.levelno,
-                'level_name': record.levelname,
-                'message': msg,
-                'raw_message': record.getMessage()
-            })
+            # Store log entry; the timestamp stays a float until it is read
+            self.log_entries.append(LogEntry(
+                record.created,
+                record.levelno,
+                record.levelname,
+                msg,
+                getattr(record, 'message', None) or record.getMessage()
+            ))
             
             # Call GUI callback if available
             if self.callback:
@@ -142,14 +201,94 @@ class GUILogHandler(logging.Handler):
             self.handleError(record)
     
     def get_recent_logs(self, count: int = 100) -> List[Dict[str, Any]]:
-        """Get recent log entries."""
-        return self.log_entries[-count:]
+        """Get recent log entries as dictionaries."""
+        return [self._as_datetime(entry) for entry in self.get_recent_entries(count)]
+    
+    def get_recent_entries(self, count: int = 100) -> List[LogEntry]:
+        """Get recent log entries as LogEntry tuples without conversion."""
+        if count <= 0:
+            return []
+        # Walk back from the newest entry so only count entries are visited
+        return list(islice(reversed(self.log_entries), count))[::-1]
+    
+    @staticmethod
+    def _as_datetime(entry: LogEntry) -> Dict[str, Any]:
+        """Convert a stored entry to a dictionary with its timestamp as a datetime."""
+        entry_dict = entry._asdict()
+        entry_dict['timestamp'] = datetime.fromtimestamp(entry.timestamp)
+        return entry_dict
     
     def clear_logs(self) -> None:
         """Clear stored log entries."""
         self.log_entries.clear()
 
 
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that writes through a large file buffer.
+    
+    Records reach the OS only when the buffer fills, a record at or above
+    flush_level is written, or the handler is flushed or closed. The file
+    size is tracked in memory so rollover checks do not flush the buffer.
+    """
+    
+    def __init__(self, filename, *args, buffer_size: int = 65536,
+                 flush_level: int = logging.ERROR, **kwargs):
+        """
+        Initialize buffered rotating file handler.
+        
+        Args:
+            filename: Log file path
+            *args: Positional arguments for RotatingFileHandler
+            buffer_size: File buffer size in bytes
+            flush_level: Records at or above this level are flushed immediately
+            **kwargs: Keyword arguments for RotatingFileHandler
+        """
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self._bytes_written = 0
+        self._pending_bytes = 0
+        self._is_regular_file = True
+        self._defer_flush = False
+        super().__init__(filename, *args, **kwargs)
+    
+    def _open(self):
+        """Open the log file with a large buffer and record its current size."""
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        stream.seek(0, os.SEEK_END)
+        self._bytes_written = stream.tell()
+        self._is_regular_file = os.path.isfile(self.baseFilename)
+        return stream
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Check rollover against the tracked size instead of seeking the stream."""
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0 and self._is_regular_file:
+            msg = "%s\n" % self.format(record)
+            # Count encoded bytes so non-ASCII records do not undercount the file size
+            self._pending_bytes = len(msg.encode(self.encoding or 'utf-8', self.errors or 'strict'))
+            if self._bytes_written + self._pending_bytes >= self.maxBytes:
+                return True
+        return False
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, deferring the flush for records below flush_level."""
+        self._defer_flush = record.levelno < self.flush_level
+        try:
+            super().emit(record)
+            self._bytes_written += self._pending_bytes
+        finally:
+            self._pending_bytes = 0
+            self._defer_flush = False
+    
+    def flush(self) -> None:
+        """Flush the file buffer unless called from a deferred emit."""
+        if not self._defer_flush:
+            super().flush()
+
+
 class ReadmarkableLogger:
     """
     Custom logger for readMarkable application.
@@ -157,9 +296,14 @@ class ReadmarkableLogger:
     Provides logging functions for markdown synchronization operations:
     - log() - Main logging with timestamp
     - error() - Error messages
-    - warn() - Warning messages  
+    - warn() / warning() - Warning messages
     - info() - Info messages
     - highlight() - Sync/highlight messages
+    - debug() - Debug messages
+    
+    These are bound per instance in __init__ directly to the underlying
+    logging.Logger calls. Each takes the message followed by optional
+    %-style arguments, and skips formatting when its level is disabled.
     """
     
     def __init__(self, name: str = "readMarkable", 
@@ -181,28 +325,69 @@ class ReadmarkableLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)
         
-        # Clear any existing handlers
-        self.logger.handlers.clear()
-        
-        # Add console handler
-        self._setup_console_handler()
-        
-        # Add file handler if specified
-        if log_file:
-            self._setup_file_handler(log_file)
+        # None of our formats use filename/lineno/funcName, so skip the
+        # per-record stack walk for this logger only
+        self.logger.findCaller = _skip_find_caller
         
-        # Add custom log level
-        logging.addLevelName(LogLevel.HIGHLIGHT.value, "HIGHLIGHT")
+        # Reuse handlers already installed with the same settings
+        config_key = (colored, log_file)
+        if getattr(self.logger, '_rm_configured', None) == config_key:
+            for handler in list(self.logger.handlers):
+                if isinstance(handler, GUILogHandler):
+                    self.logger.removeHandler(handler)
+        else:
+            # Stop the background file writer of a previous configuration
+            old_listener = getattr(self.logger, '_rm_queue_listener', None)
+            if old_listener is not None:
+                atexit.unregister(old_listener.stop)
+                old_listener.stop()
+                self.logger._rm_queue_listener = None
+            
+            # Write out and close the buffered file of a previous configuration
+            # so its records are not appended after newer ones at exit
+            old_file_handler = getattr(self.logger, '_rm_file_handler', None)
+            if old_file_handler is not None:
+                atexit.unregister(old_file_handler.flush)
+                old_file_handler.flush()
+                old_file_handler.close()
+                self.logger._rm_file_handler = None
+            
+            # Clear any existing handlers
+            self.logger.handlers.clear()
+            
+            # Add console handler
+            self._setup_console_handler()
+            
+            # Add file handler if specified
+            if log_file:
+                self._setup_file_handler(log_file)
+            
+            self.logger._rm_configured = config_key
         
         # GUI handler for log output to interface
         self.gui_handler: Optional[GUILogHandler] = None
+        
+        # Separator lines keyed by (char, length)
+        self._sep_cache: Dict[Tuple[str, int], str] = {}
+        
+        # The most recently built wrapper owns the logger's handlers
+        self.logger._rm_owner = self
+        
+        # Main logging functions, bound directly so each message skips a
+        # wrapper method frame
+        self.log = self.logger.info
+        self.error = functools.partial(self.logger.log, LogLevel.ERROR.value)
+        self.warn = functools.partial(self.logger.log, LogLevel.WARNING.value)
+        self.warning = self.warn
+        self.info = functools.partial(self.logger.log, LogLevel.INFO.value)
+        self.highlight = functools.partial(self.logger.log, LogLevel.HIGHLIGHT.value)
+        self.debug = self.logger.debug
     
     def _setup_console_handler(self) -> None:
         """Setup console logging handler."""
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.DEBUG)
-        console_formatter = ColoredFormatter(colored=self.colored, show_timestamp=True)
-        console_handler.setFormatter(console_formatter)
+        console_handler.setFormatter(_shared_formatter(self.colored))
         self.logger.addHandler(console_handler)
     
     def _setup_file_handler(self, log_file: Path) -> None:
@@ -211,21 +396,33 @@ class ReadmarkableLogger:
             # Ensure log directory exists
             log_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Create rotating file handler
-            file_handler = logging.handlers.RotatingFileHandler(
-                log_file, maxBytes=10*1024*1024, backupCount=5, encoding='utf-8'
+            # Create rotating file handler; writes are coalesced in a 64 KiB
+            # buffer and errors flush immediately
+            file_handler = BufferedRotatingFileHandler(
+                log_file, maxBytes=10*1024*1024, backupCount=5, encoding='utf-8',
+                buffer_size=65536, flush_level=logging.ERROR
             )
             file_handler.setLevel(logging.DEBUG)
+            atexit.register(file_handler.flush)
             
             # File logs should not have colors
-            file_formatter = ColoredFormatter(colored=False, show_timestamp=True)
-            file_handler.setFormatter(file_formatter)
+            file_handler.setFormatter(_shared_formatter(False))
             
-            self.logger.addHandler(file_handler)
+            # Callers only enqueue records; a background thread does the file I/O
+            log_queue: queue.Queue = queue.Queue(-1)
+            queue_listener = logging.handlers.QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            queue_listener.start()
+            atexit.register(queue_listener.stop)
+            self.logger._rm_queue_listener = queue_listener
+            self.logger._rm_file_handler = file_handler
+            
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
             
         except Exception as e:
             # If file logging fails, log to console
-            self.error(f"Failed to setup file logging: {e}")
+            self._log_args(LogLevel.ERROR.value, "Failed to setup file logging: %s", e)
     
     def add_gui_handler(self, callback: Callable[[str, int], None]) -> GUILogHandler:
         """
@@ -242,8 +439,7 @@ class ReadmarkableLogger:
         
         self.gui_handler = GUILogHandler(callback)
         self.gui_handler.setLevel(logging.DEBUG)
-        gui_formatter = ColoredFormatter(colored=False, show_timestamp=True)
-        self.gui_handler.setFormatter(gui_formatter)
+        self.gui_handler.setFormatter(_shared_formatter(False))
         
         self.logger.addHandler(self.gui_handler)
         return self.gui_handler
@@ -255,110 +451,63 @@ class ReadmarkableLogger:
     def set_colored(self, colored: bool) -> None:
         """Enable or disable colored output."""
         self.colored = colored
+        self.logger._rm_configured = (colored, self.log_file)
         
         # Update console handler formatter
         for handler in self.logger.handlers:
             if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
-                handler.setFormatter(ColoredFormatter(colored=colored, show_timestamp=True))
-    
-    # Main logging functions
+                handler.setFormatter(_shared_formatter(colored))
     
-    def log(self, message: str) -> None:
+    def _log_args(self, level: int, message: str, *args: Any) -> None:
         """
-        Main log function with timestamp.
+        Log with deferred %-style formatting.
         
         Args:
-            message: Message to log
+            level: Logging level
+            message: Message format string
+            *args: Arguments merged into message only if the record is emitted
         """
-        self.logger.info(message)
-    
-    def error(self, message: str) -> None:
-        """
-        Error logging function.
-        
-        Args:
-            message: Error message to log
-        """
-        self.logger.log(LogLevel.ERROR.value, message)
-    
-    def warn(self, message: str) -> None:
-        """
-        Warning logging function.
-        
-        Args:
-            message: Warning message to log
-        """
-        self.logger.log(LogLevel.WARNING.value, message)
-    
-    def warning(self, message: str) -> None:
-        """
-        Warning logging function (alias for warn()).
-        
-        Args:
-            message: Warning message to log
-        """
-        self.warn(message)
-    
-    def info(self, message: str) -> None:
-        """
-        Info logging function.
-        
-        Args:
-            message: Info message to log
-        """
-        self.logger.log(LogLevel.INFO.value, message)
-    
-    def highlight(self, message: str) -> None:
-        """
-        Highlight/sync logging function.
-        
-        Args:
-            message: Highlight message to log
-        """
-        self.logger.log(LogLevel.HIGHLIGHT.value, message)
-    
-    def debug(self, message: str) -> None:
-        """
-        Debug logging function.
-        
-        Args:
-            message: Debug message to log
-        """
-        self.logger.debug(message)
+        self.logger.log(level, message, *args)
     
     # Convenience methods for formatted output
     
     def log_separator(self, char: str = "=", length: int = 70) -> None:
         """Log a separator line."""
-        self.highlight(char * length)
+        if not self.logger.isEnabledFor(LogLevel.HIGHLIGHT.value):
+            return
+        separator = self._sep_cache.get((char, length))
+        if separator is None:
+            separator = self._sep_cache[(char, length)] = char * length
+        self.highlight(separator)
     
     def log_header(self, title: str, char: str = "=") -> None:
         """Log a header with title."""
-        self.log_separator(char)
-        centered_title = f" {title} ".center(70, char)
-        self.highlight(centered_title)
-        self.log_separator(char)
+        if not self.logger.isEnabledFor(LogLevel.HIGHLIGHT.value):
+            return
+        self.highlight(_header_block(title, char))
     
     def log_sync_status(self, operation: str, status: str, details: str = "") -> None:
         """Log sync operation status."""
-        status_msg = f"Sync {operation}: {status}"
-        if details:
-            status_msg += f" - {details}"
-        self.highlight(status_msg)
+        if not self.logger.isEnabledFor(LogLevel.HIGHLIGHT.value):
+            return
+        self._log_args(LogLevel.HIGHLIGHT.value, "Sync %s: %s%s",
+                       operation, status, f" - {details}" if details else "")
     
     def log_progress(self, current: int, total: int, message: str = "") -> None:
         """Log progress information."""
+        if not self.logger.isEnabledFor(LogLevel.INFO.value):
+            return
         percentage = (current / total * 100) if total > 0 else 0
-        progress_msg = f"Progress: {current}/{total} ({percentage:.1f}%)"
-        if message:
-            progress_msg += f" - {message}"
-        self.info(progress_msg)
+        self._log_args(LogLevel.INFO.value, "Progress: %d/%d (%.1f%%)%s",
+                       current, total, percentage, f" - {message}" if message else "")
     
     def log_dict(self, data: Dict[str, Any], title: str = "Information") -> None:
         """Log dictionary data in a formatted way."""
-        self.info(f"{title}:")
-        for key, value in data.items():
-            self.info(f"  {key}: {value}")
+        if not self.logger.isEnabledFor(LogLevel.INFO.value):
+            return
+        lines = [f"{title}:"]
+        lines.extend(f"  {key}: {value}" for key, value in data.items())
+        self.info("\n".join(lines))
     
     # Context manager support for section logging
     
@@ -425,7 +574,19 @@ def setup_logging(name: str = "readMarkable",
         Configured ReadmarkableLogger instance
     """
     global _global_logger
-    
+
+    # Reuse the existing logger instead of tearing down and re-adding handlers,
+    # but only while it still owns the logging.Logger with the same log file
+    std_logger = logging.getLogger(name)
+    configured = getattr(std_logger, '_rm_configured', None)
+    if (_global_logger is not None
+            and getattr(std_logger, '_rm_owner', None) is _global_logger
+            and configured is not None and configured[1] == log_file):
+        if _global_logger.colored != colored:
+            _global_logger.set_colored(colored)
+        _global_logger.set_level(level)
+        return _global_logger
+
     _global_logger = ReadmarkableLogger(name=name, colored=colored, log_file=log_file)
     _global_logger.set_level(level)
     
@@ -485,4 +646,38 @@ def highlight(message: str) -> None:
 
 def debug(message: str) -> None:
     """Log debug message."""
-    get_logger().debug(message)
\ No newline at end of file
+    get_logger().debug(message)
+
+
+# Direct stdout fast path
+
+_INFO_PREFIX = '[INFO] '
+
+
+def fastlog_info(message: str) -> None:
+    """
+    Write an info line straight to stdout, bypassing the logging framework.
+    
+    Intended for high-frequency output such as progress updates in tight loops.
+    The message does not reach file or GUI handlers and ignores the configured
+    log level, so use the regular logger for anything that should be recorded.
+    
+    Args:
+        message: Message to write
+    """
+    stream = sys.stdout
+    if stream is None:
+        return
+    
+    line = _INFO_PREFIX + message + '\n'
+    buffer = getattr(stream, 'buffer', None)
+    if buffer is None:
+        # Redirected to a text-only stream such as io.StringIO
+        stream.write(line)
+        return
+    
+    # Flush pending print() output first so lines keep their order; the
+    # buffered writer retries short writes until every byte is written
+    stream.flush()
+    buffer.write(line.encode(stream.encoding or 'utf-8', 'replace'))
+    buffer.flush()
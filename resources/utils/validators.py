@@ -7,27 +7,154 @@ file paths, network connectivity, and markdown sync operations.
 
 import re
 import os
+import stat
+import errno
 import socket
-import subprocess
+import time
 import logging
 from pathlib import Path
-from typing import Union, Optional, List, Tuple, Dict, Any
-from ipaddress import IPv4Address, AddressValueError
+from types import MappingProxyType
+from typing import Union, Optional, List, Tuple, Dict, Any, Callable
+from ipaddress import IPv4Address, AddressValueError, ip_network
 from urllib.parse import urlparse
 
 
+# Hostname labels: alphanumeric ends, hyphens inside, at most 63 characters
+_HOSTNAME_RE = re.compile(
+    r'^[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?'
+    r'(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$'
+)
+
+# Characters not allowed in filenames on common filesystems
+_FILENAME_BAD_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+# Password characters that break SSH password entry, in reporting order
+_BAD_PW_CHAR_ORDER = '\n\r\0'
+_BAD_PW_CHARS = frozenset(_BAD_PW_CHAR_ORDER)
+
+# errno values that pathlib treats as "path does not exist"
+_MISSING_PATH_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+
+# Result of the one-time "import paramiko" probe; None until checked
+_paramiko_probe: Optional[bool] = None
+
+# Resolved hostnames: hostname -> (expiry time, IPv4 address)
+_DNS_CACHE_TTL = 300.0
+_DNS_CACHE_MAX_SIZE = 256
+_dns_cache: Dict[str, Tuple[float, str]] = {}
+
+
+def _cached_resolution(hostname: str) -> Optional[str]:
+    """Return a cached, unexpired IPv4 address for hostname, if any."""
+    cached = _dns_cache.get(hostname)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def _store_resolution(hostname: str, resolved_ip: str) -> None:
+    """Cache a hostname resolution, evicting the oldest entry when full."""
+    if hostname not in _dns_cache and len(_dns_cache) >= _DNS_CACHE_MAX_SIZE:
+        _dns_cache.pop(next(iter(_dns_cache)), None)
+    _dns_cache[hostname] = (time.monotonic() + _DNS_CACHE_TTL, resolved_ip)
+
+
+def _resolve_host(hostname: str) -> str:
+    """
+    Resolve hostname to an IPv4 address, using a TTL cache.
+    
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved
+    """
+    resolved_ip = _cached_resolution(hostname)
+    if resolved_ip is None:
+        resolved_ip = socket.gethostbyname(hostname)
+        _store_resolution(hostname, resolved_ip)
+    return resolved_ip
+
+
+def _fast_parse_ipv4(address: str) -> Optional[int]:
+    """
+    Parse a dotted-quad IPv4 string into its 32-bit integer value.
+    
+    Accepts exactly what IPv4Address accepts: four ASCII decimal octets
+    in 0-255 without leading zeros.
+    
+    Returns:
+        Integer address, or None if address is not a valid IPv4 literal
+    """
+    parts = address.split('.')
+    if len(parts) != 4:
+        return None
+    value = 0
+    for part in parts:
+        if not (0 < len(part) <= 3 and part.isascii() and part.isdigit()):
+            return None
+        if len(part) > 1 and part[0] == '0':
+            return None
+        octet = int(part)
+        if octet > 255:
+            return None
+        value = (value << 8) | octet
+    return value
+
+
+def _ipv4_int_rejection(ip_int: int) -> Optional[str]:
+    """
+    Check a parsed IPv4 address against the ranges reMarkable devices never use.
+    
+    Returns:
+        Reason the address is rejected, or None if it is acceptable
+    """
+    if (ip_int & 0xFF000000) == 0x7F000000:  # 127.0.0.0/8
+        return "Loopback addresses are not valid for reMarkable devices"
+    if 0xE0000000 <= ip_int < 0xF0000000:  # 224.0.0.0/4
+        return "Multicast addresses are not valid for reMarkable devices"
+    return None
+
+
+def _is_dotted_digits(address: str) -> bool:
+    """Return True if address is four dot-separated groups of ASCII digits."""
+    parts = address.split('.')
+    return len(parts) == 4 and all(part.isascii() and part.isdigit() for part in parts)
+
+
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
 
 
 class ValidationResult:
-    """Result of a validation operation."""
+    """Result of a validation operation. Instances are immutable and may be shared."""
+    
+    __slots__ = ('is_valid', 'message', '_details', '_details_factory')
+    
+    def __init__(self, is_valid: bool, message: str = "", details: Optional[Dict[str, Any]] = None,
+                 details_factory: Optional[Callable[[], Dict[str, Any]]] = None):
+        _set = object.__setattr__
+        _set(self, 'is_valid', is_valid)
+        _set(self, 'message', message)
+        _set(self, '_details', details if details is not None else ({} if details_factory is None else None))
+        _set(self, '_details_factory', details_factory)
     
-    def __init__(self, is_valid: bool, message: str = "", details: Optional[Dict[str, Any]] = None):
-        self.is_valid = is_valid
-        self.message = message
-        self.details = details or {}
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Validation details, built on first access when a factory was given."""
+        if self._details is None:
+            object.__setattr__(self, '_details', self._details_factory())
+            object.__setattr__(self, '_details_factory', None)
+        return self._details
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"ValidationResult is immutable; cannot set {name!r}")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"ValidationResult is immutable; cannot delete {name!r}")
+    
+    def __reduce__(self):
+        # Rebuild through __init__ for copy, deepcopy and pickle; details become
+        # a plain dict since shared results hold a read-only mapping proxy
+        return (type(self), (self.is_valid, self.message, dict(self.details)))
     
     def __bool__(self) -> bool:
         return self.is_valid
@@ -36,6 +163,14 @@ class ValidationResult:
         return f"ValidationResult(valid={self.is_valid}, message='{self.message}')"
 
 
+# Shared results for parameterless failures; details is read-only so sharing is safe
+_NO_DETAILS = MappingProxyType({})
+_FAIL_EMPTY_IP = ValidationResult(False, "IP address cannot be empty", _NO_DETAILS)
+_FAIL_EMPTY_PW = ValidationResult(False, "Password cannot be empty", _NO_DETAILS)
+_FAIL_HOSTNAME_FMT = ValidationResult(False, "Invalid hostname format", _NO_DETAILS)
+_FAIL_IP_FMT = ValidationResult(False, "Invalid IP address format. Expected format: xxx.xxx.xxx.xxx", _NO_DETAILS)
+
+
 class Validator:
     """
     Comprehensive validator class for readMarkable.
@@ -47,10 +182,6 @@ class Validator:
     def __init__(self):
         self._logger = logging.getLogger(__name__)
         
-        # Regex patterns
-        self.ip_pattern = re.compile(r'^[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}$')
-        self.hostname_pattern = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$')
-        
         # Common reMarkable IP ranges
         self.remarkable_networks = [
             "10.11.99.0/24",    # USB ethernet default
@@ -58,9 +189,17 @@ class Validator:
             "172.16.0.0/12",    # Private networks
             "10.0.0.0/8"        # Private networks
         ]
+        self._remarkable_networks_parsed = [ip_network(n) for n in self.remarkable_networks]
+        self._remarkable_masks = [
+            (int(net.network_address), int(net.netmask)) for net in self._remarkable_networks_parsed
+        ]
         
         # Markdown file extensions
         self.markdown_extensions = [".md", ".markdown", ".mdown", ".mkd", ".txt"]
+        self.markdown_extensions_set = frozenset(self.markdown_extensions)
+        
+        # SSH client availability does not change during a run
+        self._ssh_req_cache: Optional[ValidationResult] = None
     
     def validate_ip_address(self, ip_address: str, allow_hostnames: bool = False) -> ValidationResult:
         """
@@ -74,75 +213,126 @@ class Validator:
             ValidationResult with validation status and details
         """
         if not ip_address or not isinstance(ip_address, str):
-            return ValidationResult(False, "IP address cannot be empty")
+            return _FAIL_EMPTY_IP
         
         ip_address = ip_address.strip()
         
-        # Check basic format with regex
-        if self.ip_pattern.match(ip_address):
-            try:
-                # Validate with ipaddress module
-                ip_obj = IPv4Address(ip_address)
-                
-                # Additional checks for reMarkable devices
-                is_remarkable_range = self._is_remarkable_ip_range(ip_address)
-                is_private = ip_obj.is_private
-                
-                details = {
-                    "ip_object": ip_obj,
-                    "is_private": is_private,
-                    "is_remarkable_range": is_remarkable_range,
-                    "ip_type": "ipv4"
-                }
-                
-                if ip_obj.is_loopback:
-                    return ValidationResult(False, "Loopback addresses are not valid for reMarkable devices", details)
-                
-                if ip_obj.is_multicast:
-                    return ValidationResult(False, "Multicast addresses are not valid for reMarkable devices", details)
-                
-                return ValidationResult(True, "Valid IP address", details)
-                
-            except AddressValueError as e:
-                return ValidationResult(False, f"Invalid IP address format: {e}")
+        result = self._validate_ip_literal(ip_address)
+        if result is not None:
+            return result
         
         # If not a valid IP, check if it's a hostname (if allowed)
         if allow_hostnames:
-            if self.hostname_pattern.match(ip_address):
+            return self._validate_hostname(ip_address)
+        
+        return _FAIL_IP_FMT
+    
+    def _validate_ip_literal(self, ip_address: str) -> Optional[ValidationResult]:
+        """
+        Validate a stripped IPv4 literal.
+        
+        Returns:
+            ValidationResult for the literal, or None if ip_address does not
+            look like an IPv4 literal (four dot-separated groups of digits)
+        """
+        # Parse the literal straight to an integer
+        ip_int = _fast_parse_ipv4(ip_address)
+        if ip_int is None:
+            # Dotted all-digit input is a malformed literal, never a hostname:
+            # resolvers read zero-padded octets as octal
+            if _is_dotted_digits(ip_address):
                 try:
-                    # Try to resolve hostname
-                    resolved_ip = socket.gethostbyname(ip_address)
-                    recursive_result = self.validate_ip_address(resolved_ip, allow_hostnames=False)
-                    
-                    if recursive_result.is_valid:
-                        details = recursive_result.details.copy()
-                        details.update({
-                            "original_hostname": ip_address,
-                            "resolved_ip": resolved_ip,
-                            "ip_type": "hostname"
-                        })
-                        return ValidationResult(True, f"Valid hostname resolves to {resolved_ip}", details)
-                    else:
-                        return ValidationResult(False, f"Hostname resolves to invalid IP: {recursive_result.message}")
-                        
-                except socket.gaierror as e:
-                    return ValidationResult(False, f"Cannot resolve hostname: {e}")
-            else:
-                return ValidationResult(False, "Invalid hostname format")
-        
-        return ValidationResult(False, "Invalid IP address format. Expected format: xxx.xxx.xxx.xxx")
+                    IPv4Address(ip_address)
+                except AddressValueError as e:
+                    return ValidationResult(False, f"Invalid IP address format: {e}")
+                return _FAIL_IP_FMT
+            return None
+        
+        # Details are only built if a caller actually reads them
+        def details():
+            ip_obj = IPv4Address(ip_int)
+            return {
+                "ip_object": ip_obj,
+                "is_private": ip_obj.is_private,
+                "is_remarkable_range": self._is_remarkable_ip_range(ip_int),
+                "ip_type": "ipv4"
+            }
+        
+        rejection = _ipv4_int_rejection(ip_int)
+        if rejection is not None:
+            return ValidationResult(False, rejection, details_factory=details)
+        
+        return ValidationResult(True, "Valid IP address", details_factory=details)
     
-    def _is_remarkable_ip_range(self, ip_address: str) -> bool:
-        """Check if IP address is in a typical reMarkable device range."""
+    def _validate_hostname(self, hostname: str) -> ValidationResult:
+        """Validate a stripped hostname and the address it resolves to."""
+        if not _HOSTNAME_RE.match(hostname):
+            return _FAIL_HOSTNAME_FMT
+        
         try:
-            ip = IPv4Address(ip_address)
-            from ipaddress import ip_network
+            # Try to resolve hostname
+            resolved_ip = _resolve_host(hostname)
+        except socket.gaierror as e:
+            return ValidationResult(False, f"Cannot resolve hostname: {e}")
+        return self._hostname_result(hostname, resolved_ip)
+    
+    async def validate_ip_address_async(self, ip_address: str, allow_hostnames: bool = False) -> ValidationResult:
+        """
+        Validate IP address, resolving hostnames without blocking the event loop.
+        
+        Args:
+            ip_address: IP address or hostname to validate
+            allow_hostnames: Whether to allow and resolve hostnames
             
-            for network_str in self.remarkable_networks:
-                network = ip_network(network_str)
-                if ip in network:
-                    return True
-            return False
+        Returns:
+            ValidationResult with validation status and details
+        """
+        import asyncio
+        
+        # Empty input and IP literals (accepted or rejected) need no lookup
+        if not allow_hostnames or not ip_address or not isinstance(ip_address, str):
+            return self.validate_ip_address(ip_address, allow_hostnames)
+        
+        hostname = ip_address.strip()
+        result = self._validate_ip_literal(hostname)
+        if result is not None:
+            return result
+        
+        if not _HOSTNAME_RE.match(hostname):
+            return _FAIL_HOSTNAME_FMT
+        
+        resolved_ip = _cached_resolution(hostname)
+        if resolved_ip is None:
+            try:
+                loop = asyncio.get_running_loop()
+                addr_info = await loop.getaddrinfo(hostname, None, family=socket.AF_INET)
+            except socket.gaierror as e:
+                return ValidationResult(False, f"Cannot resolve hostname: {e}")
+            resolved_ip = addr_info[0][4][0]
+            _store_resolution(hostname, resolved_ip)
+        
+        return self._hostname_result(hostname, resolved_ip)
+    
+    def _hostname_result(self, hostname: str, resolved_ip: str) -> ValidationResult:
+        """Build the validation result for a hostname from its resolved IP."""
+        recursive_result = self.validate_ip_address(resolved_ip, allow_hostnames=False)
+        
+        if recursive_result.is_valid:
+            details = recursive_result.details.copy()
+            details.update({
+                "original_hostname": hostname,
+                "resolved_ip": resolved_ip,
+                "ip_type": "hostname"
+            })
+            return ValidationResult(True, f"Valid hostname resolves to {resolved_ip}", details)
+        else:
+            return ValidationResult(False, f"Hostname resolves to invalid IP: {recursive_result.message}")
+    
+    def _is_remarkable_ip_range(self, ip_address: Union[str, int, IPv4Address]) -> bool:
+        """Check if IP address is in a typical reMarkable device range."""
+        try:
+            ip_int = int(IPv4Address(ip_address) if isinstance(ip_address, str) else ip_address)
+            return any((ip_int & mask) == network for network, mask in self._remarkable_masks)
         except (AddressValueError, ValueError):
             return False
     
@@ -159,7 +349,7 @@ class Validator:
             ValidationResult with validation status
         """
         if not password:
-            return ValidationResult(False, "Password cannot be empty")
+            return _FAIL_EMPTY_PW
         
         if not isinstance(password, str):
             return ValidationResult(False, "Password must be a string")
@@ -171,18 +361,29 @@ class Validator:
             return ValidationResult(False, f"Password too long (maximum {max_length} characters)")
         
         # Check for problematic characters that might cause SSH issues
-        problematic_chars = ['\n', '\r', '\0']
-        for char in problematic_chars:
-            if char in password:
-                return ValidationResult(False, f"Password contains invalid character: {repr(char)}")
+        bad_chars = _BAD_PW_CHARS.intersection(password)
+        if bad_chars:
+            char = next(c for c in _BAD_PW_CHAR_ORDER if c in bad_chars)
+            return ValidationResult(False, f"Password contains invalid character: {repr(char)}")
+        
+        # Basic strength indicators, collected in a single pass
+        has_upper = has_lower = has_digit = has_special = False
+        for c in password:
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            if c.isdigit():
+                has_digit = True
+            elif not c.isalnum():
+                has_special = True
         
-        # Basic strength indicators
         details = {
             "length": len(password),
-            "has_uppercase": any(c.isupper() for c in password),
-            "has_lowercase": any(c.islower() for c in password),
-            "has_digits": any(c.isdigit() for c in password),
-            "has_special": any(not c.isalnum() for c in password)
+            "has_uppercase": has_upper,
+            "has_lowercase": has_lower,
+            "has_digits": has_digit,
+            "has_special": has_special
         }
         
         return ValidationResult(True, "Valid password", details)
@@ -192,7 +393,8 @@ class Validator:
                           must_be_file: bool = False,
                           must_be_dir: bool = False,
                           must_be_readable: bool = False,
-                          must_be_writable: bool = False) -> ValidationResult:
+                          must_be_writable: bool = False,
+                          collect_permission_details: bool = False) -> ValidationResult:
         """
         Validate file path and check various conditions.
         
@@ -203,6 +405,8 @@ class Validator:
             must_be_dir: Whether the path must be a directory
             must_be_readable: Whether the path must be readable
             must_be_writable: Whether the path must be writable
+            collect_permission_details: Whether to add readable/writable/executable
+                flags to details (three extra access checks)
             
         Returns:
             ValidationResult with validation status and path details
@@ -218,8 +422,17 @@ class Validator:
                 # Allow relative paths but warn about potential security issues with ..
                 self._logger.warning(f"Path contains '..' which may be a security risk: {file_path}")
             
-            # Check existence
-            exists = path_obj.exists()
+            # Check existence with a single stat call
+            try:
+                path_stat = os.stat(path_obj)
+            except OSError as e:
+                if e.errno not in _MISSING_PATH_ERRNOS:
+                    raise
+                path_stat = None
+            except ValueError:
+                # Unrepresentable paths (e.g. embedded NUL) do not exist, as with Path.exists()
+                path_stat = None
+            exists = path_stat is not None
             if must_exist and not exists:
                 return ValidationResult(False, f"Path does not exist: {file_path}")
             
@@ -231,14 +444,14 @@ class Validator:
             }
             
             if exists:
-                is_file = path_obj.is_file()
-                is_dir = path_obj.is_dir()
+                is_file = stat.S_ISREG(path_stat.st_mode)
+                is_dir = stat.S_ISDIR(path_stat.st_mode)
                 
                 details.update({
                     "is_file": is_file,
                     "is_dir": is_dir,
-                    "is_symlink": path_obj.is_symlink(),
-                    "size_bytes": path_obj.stat().st_size if is_file else None
+                    "is_symlink": stat.S_ISLNK(os.lstat(path_obj).st_mode),
+                    "size_bytes": path_stat.st_size if is_file else None
                 })
                 
                 # Type checks
@@ -255,11 +468,12 @@ class Validator:
                 if must_be_writable and not os.access(path_obj, os.W_OK):
                     return ValidationResult(False, f"Path is not writable: {file_path}")
                 
-                details.update({
-                    "readable": os.access(path_obj, os.R_OK),
-                    "writable": os.access(path_obj, os.W_OK),
-                    "executable": os.access(path_obj, os.X_OK)
-                })
+                if collect_permission_details:
+                    details.update({
+                        "readable": os.access(path_obj, os.R_OK),
+                        "writable": os.access(path_obj, os.W_OK),
+                        "executable": os.access(path_obj, os.X_OK)
+                    })
             
             return ValidationResult(True, "Valid file path", details)
             
@@ -280,10 +494,10 @@ class Validator:
         if not path_result.is_valid:
             return path_result
         
-        path_obj = Path(file_path)
+        path_obj = path_result.details["path_object"]
         
         # Check file extension
-        if path_obj.suffix.lower() not in self.markdown_extensions:
+        if path_obj.suffix.lower() not in self.markdown_extensions_set:
             return ValidationResult(
                 False, 
                 f"File extension '{path_obj.suffix}' is not a recognized markdown extension. "
@@ -294,17 +508,9 @@ class Validator:
         try:
             content = path_obj.read_text(encoding='utf-8', errors='ignore')
             
-            # Basic markdown validation
-            is_likely_markdown = any([
-                content.startswith('#'),  # Headers
-                '# ' in content,          # Headers with space
-                '## ' in content,         # Subheaders
-                '**' in content,          # Bold text
-                '*' in content and not content.count('*') < 2,  # Italic or emphasis
-                '[' in content and '](' in content,  # Links
-                '```' in content,         # Code blocks
-                content.strip() == '' or len(content.strip()) > 0  # Empty or has content
-            ])
+            # Any non-blank text counts; every markdown marker (headers, bold,
+            # code blocks, links) is itself non-blank, so no separate scan is needed
+            is_likely_markdown = bool(content.strip())
             
             details = {
                 "file_size": len(content),
@@ -329,22 +535,23 @@ class Validator:
         Returns:
             ValidationResult with directory validation status
         """
+        exists = Path(dir_path).exists()
         dir_result = self.validate_file_path(
             dir_path, 
             must_exist=False,  # Directory might not exist yet
-            must_be_dir=True if Path(dir_path).exists() else False,
-            must_be_readable=True if Path(dir_path).exists() else False,
-            must_be_writable=True if Path(dir_path).exists() else False
+            must_be_dir=exists,
+            must_be_readable=exists,
+            must_be_writable=exists
         )
         
-        if not dir_result.is_valid and Path(dir_path).exists():
+        if not dir_result.is_valid and exists:
             return dir_result
         
-        path_obj = Path(dir_path)
+        path_obj = dir_result.details.get("path_object") or Path(dir_path)
         
         try:
             # If directory doesn't exist, check if we can create it
-            if not path_obj.exists():
+            if not exists:
                 # Check if parent directory is writable
                 parent = path_obj.parent
                 if not parent.exists():
@@ -354,14 +561,13 @@ class Validator:
             
             # Count markdown files if directory exists
             markdown_count = 0
-            if path_obj.exists():
-                for ext in self.markdown_extensions:
-                    markdown_count += len(list(path_obj.glob(f"**/*{ext}")))
+            if exists:
+                markdown_count = self._count_markdown_files(path_obj)
             
             details = {
-                "can_create": not path_obj.exists() and os.access(path_obj.parent, os.W_OK),
+                "can_create": not exists and os.access(path_obj.parent, os.W_OK),
                 "markdown_files_count": markdown_count,
-                "is_empty": markdown_count == 0 if path_obj.exists() else True
+                "is_empty": markdown_count == 0 if exists else True
             }
             
             return ValidationResult(True, "Valid sync directory", details)
@@ -369,6 +575,28 @@ class Validator:
         except Exception as e:
             return ValidationResult(False, f"Error validating sync directory: {e}")
     
+    def _count_markdown_files(self, root: Path, stop_at_first: bool = False) -> int:
+        """
+        Count markdown files under a directory in a single tree walk.
+        
+        Args:
+            root: Directory to search recursively
+            stop_at_first: Return as soon as one markdown file is found
+            
+        Returns:
+            Number of markdown files found (at most 1 if stop_at_first)
+        """
+        extensions = self.markdown_extensions_set
+        count = 0
+        for _dirpath, _dirnames, filenames in os.walk(root):
+            for filename in filenames:
+                dot = filename.rfind('.')
+                if dot >= 0 and filename[dot:].lower() in extensions:
+                    count += 1
+                    if stop_at_first:
+                        return count
+        return count
+    
     def check_network_connectivity(self, host: str, port: int = 22, timeout: int = 5) -> ValidationResult:
         """
         Check network connectivity to a host and port.
@@ -387,34 +615,33 @@ class Validator:
             if not ip_result.is_valid:
                 return ValidationResult(False, f"Invalid host: {ip_result.message}")
             
-            # Attempt socket connection
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
+            # Connect to the address validation already parsed or resolved,
+            # so hostnames are not looked up a second time
+            address = ip_result.details.get("resolved_ip") or str(ip_result.details["ip_object"])
             
             try:
-                result = sock.connect_ex((host, port))
-                sock.close()
+                with socket.create_connection((address, port), timeout=timeout):
+                    pass
                 
-                if result == 0:
-                    details = {
-                        "host": host,
-                        "port": port,
-                        "timeout": timeout,
-                        "connection_successful": True
-                    }
-                    return ValidationResult(True, f"Successfully connected to {host}:{port}", details)
-                else:
-                    details = {
-                        "host": host,
-                        "port": port,
-                        "timeout": timeout,
-                        "connection_successful": False,
-                        "error_code": result
-                    }
-                    return ValidationResult(False, f"Cannot connect to {host}:{port} (error {result})", details)
+                details = {
+                    "host": host,
+                    "port": port,
+                    "timeout": timeout,
+                    "connection_successful": True
+                }
+                return ValidationResult(True, f"Successfully connected to {host}:{port}", details)
                     
             except socket.timeout:
                 return ValidationResult(False, f"Connection to {host}:{port} timed out after {timeout} seconds")
+            except OSError as e:
+                details = {
+                    "host": host,
+                    "port": port,
+                    "timeout": timeout,
+                    "connection_successful": False,
+                    "error_code": e.errno
+                }
+                return ValidationResult(False, f"Cannot connect to {host}:{port} (error {e.errno})", details)
             except Exception as e:
                 return ValidationResult(False, f"Connection error: {e}")
                 
@@ -425,18 +652,32 @@ class Validator:
         """
         Check if SSH client requirements are met.
         
+        The result is computed once and cached; see invalidate_ssh_cache().
+        
         Returns:
             ValidationResult with SSH requirements status
         """
-        # Check for paramiko (primary SSH client)
-        paramiko_available = False
-        try:
-            import paramiko
-            paramiko_available = True
-        except ImportError:
-            pass
+        if self._ssh_req_cache is None:
+            self._ssh_req_cache = self._probe_ssh_requirements()
+        return self._ssh_req_cache
+    
+    def invalidate_ssh_cache(self) -> None:
+        """Forget the cached check_ssh_requirements() result."""
+        self._ssh_req_cache = None
+    
+    def _probe_ssh_requirements(self) -> ValidationResult:
+        """Probe for paramiko and a system SSH client."""
+        global _paramiko_probe
         
-        if paramiko_available:
+        # Check for paramiko (primary SSH client), importing it at most once
+        if _paramiko_probe is None:
+            try:
+                import paramiko
+                _paramiko_probe = True
+            except ImportError:
+                _paramiko_probe = False
+        
+        if _paramiko_probe:
             details = {
                 "paramiko_available": True,
                 "primary_client": "paramiko",
@@ -445,6 +686,8 @@ class Validator:
             return ValidationResult(True, "SSH support available via paramiko", details)
         
         # Check for system SSH as fallback
+        import subprocess
+        
         ssh_available = False
         try:
             result = subprocess.run(['ssh', '-V'], capture_output=True, text=True, timeout=5)
@@ -483,8 +726,7 @@ class Validator:
             return "unnamed"
         
         # Remove problematic characters
-        problematic_chars = r'[<>:"/\\|?*\x00-\x1f]'
-        sanitized = re.sub(problematic_chars, replacement, filename)
+        sanitized = _FILENAME_BAD_CHARS_RE.sub(replacement, filename)
         
         # Remove leading/trailing dots and spaces
         sanitized = sanitized.strip('. ')
@@ -494,8 +736,7 @@ class Validator:
             sanitized = "unnamed"
         
         # Limit length
-        if len(sanitized) > 255:
-            sanitized = sanitized[:255]
+        sanitized = sanitized[:255]
         
         return sanitized
 